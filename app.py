@@ -4,6 +4,8 @@ Web interface for viewing and searching RFQ project data
 """
 
 import logging
+import time
+
 import streamlit as st
 from dotenv import load_dotenv
 
@@ -63,6 +65,8 @@ def main():
         st.session_state.preview_file = None
     if 'selected_supplier' not in st.session_state:
         st.session_state.selected_supplier = None
+    if 'refresh_proc' not in st.session_state:
+        st.session_state.refresh_proc = None
 
     # Initialize database connection
     db_manager = initialize_db_manager()
@@ -78,7 +82,7 @@ def main():
     # Run startup crawler ONLY if database is empty AND not already attempted this session
     if not all_projects and not st.session_state.data_refreshed:
         with st.spinner("🔄 Database is empty. Running initial data scan..."):
-            success, message = run_startup_crawler()
+            success, message = run_startup_crawler(db_manager)
             st.session_state.data_refreshed = True
 
             if success:
@@ -105,6 +109,13 @@ def main():
     render_center_panel(center_col, db_manager)
     render_right_panel(right_col, db_manager)
 
+    # Poll an in-flight background refresh only after every panel has
+    # rendered, so the dashboard stays fully usable during the crawl
+    # instead of being blanked by a mid-render rerun
+    if st.session_state.refresh_proc is not None:
+        time.sleep(2)
+        st.rerun()
+
 
 if __name__ == "__main__":
     main()
@@ -4,11 +4,19 @@ Configuration management for RFQ Dashboard.
 
 import os
 import json
+from functools import lru_cache
 from typing import Dict, Any
 
 
+@lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
-    """Load configuration from config.json or environment variables."""
+    """
+    Load configuration from config.json or environment variables.
+
+    The parsed config is cached for the life of the process so Streamlit
+    reruns don't re-read and re-parse the file; call
+    ``load_config.cache_clear()`` to force a reload.
+    """
     config = {}
 
     # Try to load from config.json
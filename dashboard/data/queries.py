@@ -3,11 +3,13 @@ Database query functions for RFQ Dashboard.
 """
 
 import logging
+import re
 import streamlit as st
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from rfq_tracker.db_manager import DBManager
 from dashboard.config import load_config
+from dashboard.utils.helpers import format_timestamp
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +26,13 @@ def fetch_all_suppliers(_db_manager: DBManager) -> List[str]:
         Sorted list of unique supplier names
     """
     try:
-        suppliers = _db_manager.db.suppliers.distinct("supplier_name")
-        return sorted(suppliers)
+        # $group + $sort dedupes and orders server-side over the supplier
+        # index, so Python receives the final list as-is
+        pipeline = [
+            {"$group": {"_id": "$supplier_name"}},
+            {"$sort": {"_id": 1}},
+        ]
+        return [row["_id"] for row in _db_manager.db.suppliers.aggregate(pipeline)]
     except Exception as e:
         logger.error(f"Error fetching suppliers: {e}")
         return []
@@ -43,7 +50,18 @@ def fetch_projects(_db_manager: DBManager) -> List[Dict[str, Any]]:
         List of project dictionaries
     """
     try:
-        projects = list(_db_manager.db.projects.find().sort("project_number", -1))
+        # Project to the fields the sidebar renders; the sort walks the
+        # unique project_number index backward.
+        cursor = _db_manager.db.projects.find(
+            {},
+            {"project_number": 1, "last_scanned": 1, "path": 1, "_id": 0}
+        ).sort("project_number", -1)
+        # Single pass over the cursor: materialize and precompute the
+        # lowercase search key together instead of list() plus a second loop
+        projects = []
+        for p in cursor:
+            p['project_number_lower'] = p['project_number'].lower()
+            projects.append(p)
         logger.info(f"Loaded {len(projects)} projects from database")
         return projects
     except Exception as e:
@@ -53,61 +71,280 @@ def fetch_projects(_db_manager: DBManager) -> List[Dict[str, Any]]:
 
 
 @st.cache_data(ttl=300)  # Cache for 5 minutes
-def fetch_supplier_data(_db_manager: DBManager, project_number: str) -> List[Dict[str, Any]]:
+def fetch_supplier_names(_db_manager: DBManager, project_number: str) -> List[str]:
     """
-    Fetch all supplier data (suppliers, transmissions, receipts) for a project with caching.
+    Fetch just the supplier names for a project (for selection lists).
 
     Args:
-        _db_manager: DBManager instance (underscore prefix prevents Streamlit from hashing)
-        project_number: Project number to fetch suppliers for
+        _db_manager: DBManager instance (underscore prefix prevents hashing)
+        project_number: Project number to fetch supplier names for
 
     Returns:
-        List of dictionaries containing supplier data with transmissions and receipts
+        Sorted list of supplier names
     """
     try:
-        # Fetch all suppliers for the project, sorted alphabetically
-        suppliers = list(_db_manager.db.suppliers.find(
-            {"project_number": project_number}
-        ).sort("supplier_name", 1))
+        # Sorted server-side; the (project_number, supplier_name) index
+        # serves both the match and the order
+        pipeline = [
+            {"$match": {"project_number": project_number}},
+            {"$group": {"_id": "$supplier_name"}},
+            {"$sort": {"_id": 1}},
+        ]
+        return [row["_id"] for row in _db_manager.db.suppliers.aggregate(pipeline)]
+    except Exception as e:
+        logger.error(f"Error fetching supplier names for project {project_number}: {e}")
+        return []
+
+
+@st.cache_data(ttl=300)  # Cache for 5 minutes
+def fetch_single_supplier_data(
+    _db_manager: DBManager, project_number: str, supplier_name: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetch one supplier's data (supplier doc, transmissions, receipts).
+
+    Only the selected supplier is ever rendered, so fetching per supplier
+    avoids dragging every supplier's submissions across the wire.
 
-        supplier_data = []
+    Args:
+        _db_manager: DBManager instance (underscore prefix prevents hashing)
+        project_number: Project number the supplier belongs to
+        supplier_name: Supplier to fetch
 
-        for supplier in suppliers:
-            supplier_name = supplier['supplier_name']
+    Returns:
+        Dictionary with supplier, transmissions and receipts, or None
+    """
+    try:
+        supplier = _db_manager.db.suppliers.find_one({
+            "project_number": project_number,
+            "supplier_name": supplier_name
+        })
+        if supplier is None:
+            return None
 
-            # Fetch all submissions for this supplier, sorted by date descending (newest first)
-            submissions = list(_db_manager.db.submissions.find({
+        # Exclusion projection: the panel renders folder/date/type/files but
+        # never the content hash or object id, so they stay server-side
+        submissions = _db_manager.db.submissions.find(
+            {
                 "project_number": project_number,
                 "supplier_name": supplier_name
-            }).sort("date", -1))
+            },
+            {"content_hash": 0, "_id": 0}
+        ).sort("date", -1)
+
+        # Separate into sent and received in one pass; the display timestamp
+        # is formatted here so the cache amortizes the parse across reruns
+        transmissions, receipts = [], []
+        for s in submissions:
+            s['date_fmt'] = format_timestamp(s.get('date', 'N/A'))
+            if s.get('type') == 'sent':
+                transmissions.append(s)
+            elif s.get('type') == 'received':
+                receipts.append(s)
+
+        return {
+            'supplier': supplier,
+            'transmissions': transmissions,
+            'receipts': receipts
+        }
+    except Exception as e:
+        logger.error(f"Error fetching supplier {supplier_name} for project {project_number}: {e}")
+        st.error(f"Error loading supplier data: {e}")
+        return None
+
 
-            # Separate into sent and received
-            transmissions = [s for s in submissions if s.get('type') == 'sent']
-            receipts = [s for s in submissions if s.get('type') == 'received']
+@st.cache_data(ttl=300)  # Cache for 5 minutes
+def fetch_project_statistics(_db_manager: DBManager, project_number: str) -> Dict[str, int]:
+    """
+    Fetch contacted/responded supplier counts for a project.
 
-            supplier_data.append({
-                'supplier': supplier,
-                'transmissions': transmissions,
-                'receipts': receipts
-            })
+    The crawler precomputes these counts onto the project document at
+    scan time, so the common case is a single find_one. Projects scanned
+    before that existed fall back to one $group by submission type with
+    $addToSet, which collects the distinct supplier sets server-side.
 
-        logger.info(f"Loaded {len(supplier_data)} suppliers for project {project_number}")
-        return supplier_data
+    Args:
+        _db_manager: DBManager instance (underscore prefix prevents hashing)
+        project_number: Project number to summarize
 
+    Returns:
+        Dictionary with contacted_count (suppliers with a sent submission)
+        and responded_count (suppliers with a received submission)
+    """
+    try:
+        project = _db_manager.db.projects.find_one(
+            {"project_number": project_number}, {"stats": 1, "_id": 0}
+        )
+        if project and "stats" in project:
+            return project["stats"]
+        # NOTE: $match must stay first — $group alone cannot use an index,
+        # but a leading $match on project_number rides the compound
+        # submissions index (SERVER-29444)
+        pipeline = [
+            {"$match": {"project_number": project_number}},
+            {"$group": {"_id": "$type", "suppliers": {"$addToSet": "$supplier_name"}}},
+        ]
+        counts = {
+            row["_id"]: len(row["suppliers"])
+            for row in _db_manager.db.submissions.aggregate(pipeline)
+        }
+        return {
+            "contacted_count": counts.get("sent", 0),
+            "responded_count": counts.get("received", 0),
+        }
     except Exception as e:
-        logger.error(f"Error fetching supplier data for project {project_number}: {e}")
-        st.error(f"Error loading supplier data: {e}")
-        return []
+        logger.error(f"Error fetching statistics for project {project_number}: {e}")
+        return {"contacted_count": 0, "responded_count": 0}
 
 
-def initialize_db_manager() -> Optional[DBManager]:
-    """Initialize database connection with error handling."""
+@st.cache_data(ttl=300)  # Cache for 5 minutes
+def fetch_partner_statistics(_db_manager: DBManager, project_number: str) -> Dict[str, Dict[str, int]]:
+    """
+    Fetch per-supplier sent/received submission counts for a project.
+
+    A single $group with conditional sums computes every supplier's counts
+    in one round trip; the result is keyed by supplier_name so callers get
+    O(1) lookups instead of scanning a list.
+
+    Args:
+        _db_manager: DBManager instance (underscore prefix prevents hashing)
+        project_number: Project number to summarize
+
+    Returns:
+        Dictionary mapping supplier_name to {sent_count, received_count}
+    """
+    try:
+        # NOTE: $match must stay first so the index narrows the scan; see
+        # the note in fetch_project_statistics
+        pipeline = [
+            {"$match": {"project_number": project_number}},
+            {"$group": {
+                "_id": "$supplier_name",
+                "sent_count": {"$sum": {"$cond": [{"$eq": ["$type", "sent"]}, 1, 0]}},
+                "received_count": {"$sum": {"$cond": [{"$eq": ["$type", "received"]}, 1, 0]}},
+            }},
+        ]
+        return {
+            row["_id"]: {
+                "sent_count": row["sent_count"],
+                "received_count": row["received_count"],
+            }
+            for row in _db_manager.db.submissions.aggregate(pipeline)
+        }
+    except Exception as e:
+        logger.error(f"Error fetching partner statistics for project {project_number}: {e}")
+        return {}
+
+
+def _build_project_query(
+    _db_manager: DBManager,
+    search_term: str,
+    selected_suppliers: Tuple[str, ...],
+    date_start_iso: Optional[str],
+    date_end_iso: Optional[str]
+) -> Dict[str, Any]:
+    """Build the MongoDB filter shared by the project list and count queries."""
+    query: Dict[str, Any] = {}
+
+    if search_term:
+        query["project_number"] = {"$regex": re.escape(search_term), "$options": "i"}
+
+    if selected_suppliers:
+        project_numbers = _db_manager.db.suppliers.distinct(
+            "project_number", {"supplier_name": {"$in": list(selected_suppliers)}}
+        )
+        query.setdefault("project_number", {})["$in"] = project_numbers
+
+    if date_start_iso or date_end_iso:
+        # last_scanned is stored as ISO 8601, so range compares lexically
+        date_filter = {}
+        if date_start_iso:
+            date_filter["$gte"] = date_start_iso
+        if date_end_iso:
+            date_filter["$lte"] = date_end_iso
+        query["last_scanned"] = date_filter
+
+    return query
+
+
+@st.cache_data(ttl=300)  # Cache for 5 minutes
+def fetch_projects_page(
+    _db_manager: DBManager,
+    search_term: str = "",
+    selected_suppliers: Tuple[str, ...] = (),
+    date_start_iso: Optional[str] = None,
+    date_end_iso: Optional[str] = None,
+    sort_field: str = "project_number",
+    sort_dir: int = -1,
+    skip: int = 0,
+    limit: int = 0
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Fetch one page of projects plus the total match count in one round trip.
+
+    $facet runs the paginated page and the count over a single $match, so
+    the sidebar's "Showing X of Y" needs one server call instead of two.
+
+    Args:
+        _db_manager: DBManager instance (underscore prefix prevents hashing)
+        search_term: Case-insensitive substring match on project_number
+        selected_suppliers: Supplier names the project must have one of
+        date_start_iso: Inclusive ISO lower bound on last_scanned
+        date_end_iso: Inclusive ISO upper bound on last_scanned
+        sort_field: Field to sort by
+        sort_dir: 1 ascending, -1 descending
+        skip: Number of matching projects to skip
+        limit: Page size (0 = no limit)
+
+    Returns:
+        Tuple of (page of project dictionaries, total matching count)
+    """
+    try:
+        query = _build_project_query(
+            _db_manager, search_term, selected_suppliers, date_start_iso, date_end_iso
+        )
+        page_stages: List[Dict[str, Any]] = [
+            {"$sort": {sort_field: sort_dir}},
+            {"$skip": skip},
+        ]
+        if limit:
+            page_stages.append({"$limit": limit})
+        page_stages.append(
+            {"$project": {"project_number": 1, "last_scanned": 1, "path": 1, "_id": 0}}
+        )
+        pipeline = [
+            # $match ahead of $facet so the index is consulted once for
+            # both sub-pipelines
+            {"$match": query},
+            {"$facet": {"page": page_stages, "total": [{"$count": "n"}]}},
+        ]
+        result = next(_db_manager.db.projects.aggregate(pipeline))
+        total = result["total"][0]["n"] if result["total"] else 0
+        return result["page"], total
+    except Exception as e:
+        logger.error(f"Error fetching project page: {e}")
+        st.error(f"Error fetching projects: {e}")
+        return [], 0
+
+
+@st.cache_resource
+def _get_db_manager() -> DBManager:
+    """Build and connect the DBManager once per server process.
+
+    st.cache_resource keeps the MongoClient (and its connection pool)
+    alive across reruns instead of re-connecting on every widget
+    interaction.
+    """
     config = load_config()
+    db_manager = DBManager(config['mongo_uri'], config['mongo_db'])
+    db_manager.connect()
+    return db_manager
+
 
+def initialize_db_manager() -> Optional[DBManager]:
+    """Initialize database connection with error handling."""
     try:
-        db_manager = DBManager(config['mongo_uri'], config['mongo_db'])
-        db_manager.connect()
-        return db_manager
+        return _get_db_manager()
     except Exception as e:
         logger.error(f"Failed to connect to database: {e}")
         st.error("❌ Failed to connect to MongoDB. Please check the database is running.")
@@ -6,7 +6,6 @@ import os
 import logging
 from collections import defaultdict
 from datetime import datetime
-from pathlib import Path
 from typing import List, Dict, Any
 
 from rfq_tracker.db_manager import DBManager
@@ -38,10 +37,18 @@ def filter_projects(
     """
     filtered = projects
 
-    # Filter by search term
+    # Filter by search term. project_number_lower is precomputed at fetch
+    # time; for projects from other sources it is memoized on first use so
+    # repeated filter calls never re-lower the same number.
     if search_term:
         search_lower = search_term.lower()
-        filtered = [p for p in filtered if search_lower in p['project_number'].lower()]
+        filtered = [
+            p for p in filtered
+            if search_lower in (
+                p.get('project_number_lower')
+                or p.setdefault('project_number_lower', p['project_number'].lower())
+            )
+        ]
 
     # Filter by suppliers (if project has at least one selected supplier)
     if selected_suppliers and db_manager:
@@ -108,12 +115,12 @@ def calculate_folder_statistics(files: List[str]) -> Dict[str, Any]:
     existing_files = 0
 
     for file_path in files:
+        # One stat per file: a failed stat means missing/unreadable, so the
+        # separate exists() check (a second stat) is redundant
         try:
-            path = Path(file_path)
-            if path.exists():
-                total_size += path.stat().st_size
-                existing_files += 1
-        except:
+            total_size += os.stat(file_path).st_size
+            existing_files += 1
+        except OSError:
             continue
 
     return {
@@ -190,27 +197,25 @@ def build_folder_tree(file_paths: List[str], base_path: str) -> Dict[str, Any]:
         Nested dict representing folder hierarchy
     """
     tree = {}
+    sep = os.sep
+    # Normalize the base to end in exactly one separator so each path needs
+    # just a startswith + slice — no per-path lstrip on the common case
+    base = (base_path.rstrip('/\\') + sep) if base_path else ''
+    base_len = len(base)
 
     for path in file_paths:
-        try:
-            relative_path = path.replace(base_path, '').lstrip('/').lstrip('\\')
-            parts = relative_path.split(os.sep)
-
-            current_level = tree
-            for i, part in enumerate(parts):
-                if i == len(parts) - 1:  # File
-                    if '__files__' not in current_level:
-                        current_level['__files__'] = []
-                    current_level['__files__'].append({
-                        'name': part,
-                        'path': path
-                    })
-                else:  # Folder
-                    if part not in current_level:
-                        current_level[part] = {}
-                    current_level = current_level[part]
-        except Exception as e:
-            logger.error(f"Error parsing path {path}: {e}")
-            continue
+        if base and path.startswith(base):
+            relative_path = path[base_len:]
+        else:
+            relative_path = path.lstrip('/\\')
+
+        parts = relative_path.split(sep)
+        current_level = tree
+        for part in parts[:-1]:  # Folders
+            current_level = current_level.setdefault(part, {})
+        current_level.setdefault('__files__', []).append({
+            'name': parts[-1],
+            'path': path
+        })
 
     return tree
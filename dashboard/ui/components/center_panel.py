@@ -8,7 +8,11 @@ import streamlit as st
 from pathlib import Path
 
 from rfq_tracker.db_manager import DBManager
-from dashboard.data.queries import fetch_supplier_data
+from dashboard.data.queries import (
+    fetch_supplier_names,
+    fetch_single_supplier_data,
+    fetch_project_statistics,
+)
 from dashboard.logic.processing import calculate_supplier_statistics, calculate_folder_statistics, group_events_by_folder_name, build_folder_tree
 from dashboard.styles import get_statistics_badge, format_file_size
 from dashboard.utils.helpers import format_timestamp, create_file_link
@@ -18,6 +22,16 @@ from dashboard.ui.views.file_preview import render_file_preview
 logger = logging.getLogger(__name__)
 
 
+@st.cache_data(max_entries=256)
+def _cached_folder_tree(file_paths: tuple, base_path: str):
+    """Build (or reuse) the folder tree for one submission's file list.
+
+    Keyed on the file tuple + base path so reruns triggered by unrelated
+    widgets skip the rebuild.
+    """
+    return build_folder_tree(list(file_paths), base_path)
+
+
 def render_center_panel(center_col, db_manager: DBManager):
     """
     Render center panel with project details, supplier statistics, and transmission/receipt display.
@@ -35,22 +49,19 @@ def render_center_panel(center_col, db_manager: DBManager):
         if st.session_state.selected_project:
             project = st.session_state.selected_project
 
-            # Fetch supplier data for the project
+            # Fetch supplier names, then only the selected supplier's data —
+            # the other suppliers' submissions are never rendered here
             with st.spinner("Loading supplier data..."):
-                supplier_data = fetch_supplier_data(db_manager, project['project_number'])
+                supplier_names = fetch_supplier_names(db_manager, project['project_number'])
 
             # Auto-select first supplier if none selected or current selection invalid
-            if supplier_data:
-                supplier_names = [d['supplier']['supplier_name'] for d in supplier_data]
-
+            if supplier_names:
                 if (not st.session_state.selected_supplier or
                     st.session_state.selected_supplier not in supplier_names):
                     st.session_state.selected_supplier = supplier_names[0]
 
-                # Find the selected supplier's data
-                selected_data = next(
-                    (d for d in supplier_data if d['supplier']['supplier_name'] == st.session_state.selected_supplier),
-                    None
+                selected_data = fetch_single_supplier_data(
+                    db_manager, project['project_number'], st.session_state.selected_supplier
                 )
 
                 if selected_data:
@@ -66,6 +77,13 @@ def render_center_panel(center_col, db_manager: DBManager):
                         formatted_date = format_timestamp(project['last_scanned'])
                         st.caption(f"📅 Last Scanned: {formatted_date}")
 
+                    # Project-wide response summary (one cached aggregation)
+                    project_stats = fetch_project_statistics(db_manager, project['project_number'])
+                    st.caption(
+                        f"📤 {project_stats['contacted_count']} suppliers contacted • "
+                        f"📥 {project_stats['responded_count']} responded"
+                    )
+
                     # Calculate and display supplier statistics
                     supplier_stats = calculate_supplier_statistics(transmissions, receipts)
                     stats_html = (
@@ -106,7 +124,7 @@ def render_center_panel(center_col, db_manager: DBManager):
 
                                             for trans_idx, trans in enumerate(versions):
                                                 files = trans.get('files', [])
-                                                version_date = format_timestamp(trans.get('date', 'N/A'))
+                                                version_date = trans.get('date_fmt', 'N/A')
 
                                                 # Compact version display - just timestamp and folder structure
                                                 st.markdown(f"**Version {len(versions) - trans_idx}:** {version_date}")
@@ -118,7 +136,7 @@ def render_center_panel(center_col, db_manager: DBManager):
                                                 if files:
                                                     files_to_display = files[:50]  # Limit to first 50 for version history
                                                     try:
-                                                        tree = build_folder_tree(files_to_display, trans.get('folder_path', ''))
+                                                        tree = _cached_folder_tree(tuple(files_to_display), trans.get('folder_path', ''))
                                                         with st.expander("📁 Folder Structure", expanded=False):
                                                             render_folder_tree(
                                                                 tree,
@@ -158,7 +176,7 @@ def render_center_panel(center_col, db_manager: DBManager):
                                             st.markdown(folder_stats_html, unsafe_allow_html=True)
 
                                             # Display metadata
-                                            sent_date = format_timestamp(trans.get('date', 'N/A'))
+                                            sent_date = trans.get('date_fmt', 'N/A')
                                             st.caption(f"📅 Date: {sent_date}")
 
                                             # Build and render folder tree (same as receipts)
@@ -185,7 +203,7 @@ def render_center_panel(center_col, db_manager: DBManager):
 
                                                 # Build folder tree
                                                 try:
-                                                    tree = build_folder_tree(files_to_display, trans.get('folder_path', ''))
+                                                    tree = _cached_folder_tree(tuple(files_to_display), trans.get('folder_path', ''))
 
                                                     with st.expander("📁 Folder Structure", expanded=True):
                                                         render_folder_tree(
@@ -240,7 +258,7 @@ def render_center_panel(center_col, db_manager: DBManager):
 
                                         for receipt_idx, receipt in enumerate(versions):
                                             received_files = receipt.get('files', [])
-                                            version_date = format_timestamp(receipt.get('date', 'N/A'))
+                                            version_date = receipt.get('date_fmt', 'N/A')
 
                                             # Compact version display - just timestamp and folder structure
                                             st.markdown(f"**Version {len(versions) - receipt_idx}:** {version_date}")
@@ -252,7 +270,7 @@ def render_center_panel(center_col, db_manager: DBManager):
                                             if received_files:
                                                 files_to_display = received_files[:50]  # Limit to first 50 for version history
                                                 try:
-                                                    tree = build_folder_tree(files_to_display, receipt.get('folder_path', ''))
+                                                    tree = _cached_folder_tree(tuple(files_to_display), receipt.get('folder_path', ''))
                                                     with st.expander("📁 Folder Structure", expanded=False):
                                                         render_folder_tree(
                                                             tree,
@@ -292,7 +310,7 @@ def render_center_panel(center_col, db_manager: DBManager):
                                         st.markdown(folder_stats_html, unsafe_allow_html=True)
 
                                         # Display metadata
-                                        received_date = format_timestamp(receipt.get('date', 'N/A'))
+                                        received_date = receipt.get('date_fmt', 'N/A')
                                         st.caption(f"📅 Date: {received_date}")
 
                                         # Build and render folder tree
@@ -320,7 +338,7 @@ def render_center_panel(center_col, db_manager: DBManager):
 
                                             # Build folder tree
                                             try:
-                                                tree = build_folder_tree(files_to_display, receipt.get('folder_path', ''))
+                                                tree = _cached_folder_tree(tuple(files_to_display), receipt.get('folder_path', ''))
 
                                                 # Render tree with expander for large structures
                                                 with st.expander("📁 Folder Structure", expanded=True):
@@ -3,13 +3,34 @@ File-related UI widgets for RFQ Dashboard.
 """
 
 import logging
+import os
 import streamlit as st
+from functools import lru_cache
+from hashlib import blake2b
 from pathlib import Path
 from typing import Dict, Any
 
+from dashboard.utils.helpers import create_file_link
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8192)
+def _path_key(file_path: str) -> str:
+    """Stable short digest for widget keys.
+
+    Builtin hash() is salted per process, so widget identity would churn
+    across sessions; a 6-byte blake2b digest is stable and shorter.
+    """
+    return blake2b(file_path.encode(), digest_size=6).hexdigest()
+
+
+@st.cache_data(max_entries=256)
+def _read_file_bytes(file_path: str, mtime: float) -> bytes:
+    """Read a file once per (path, mtime); reruns reuse the cached bytes."""
+    return Path(file_path).read_bytes()
+
+
 def create_download_button(file_path: str, button_label: str = "⬇️ Download", key_suffix: str = ""):
     """
     Create Streamlit download button for a file.
@@ -27,8 +48,7 @@ def create_download_button(file_path: str, button_label: str = "⬇️ Download"
             st.caption("⚠️ File not found")
             return None
 
-        with open(file_path, 'rb') as f:
-            file_data = f.read()
+        file_data = _read_file_bytes(file_path, os.path.getmtime(file_path))
 
         file_name = Path(file_path).name
 
@@ -37,7 +57,7 @@ def create_download_button(file_path: str, button_label: str = "⬇️ Download"
             data=file_data,
             file_name=file_name,
             mime='application/octet-stream',
-            key=f"download_{key_suffix}_{hash(file_path)}"
+            key=f"download_{key_suffix}_{_path_key(file_path)}"
         )
     except Exception as e:
         logger.error(f"Error creating download button for {file_path}: {e}")
@@ -56,7 +76,7 @@ def create_preview_button(file_path: str, key_suffix: str = ""):
     Returns:
         None (displays button in Streamlit)
     """
-    if st.button("👁️", key=f"preview_{key_suffix}_{hash(file_path)}", help="Preview file"):
+    if st.button("👁️", key=f"preview_{key_suffix}_{_path_key(file_path)}", help="Preview file"):
         st.session_state.preview_file = file_path
         st.rerun()
 
@@ -80,21 +100,35 @@ def render_folder_tree(tree: Dict[str, Any], indent_level: int = 0, key_prefix:
         st.markdown(f"{indent}📁 **{folder_name}**")
         render_folder_tree(subtree, indent_level + 1, f"{key_prefix}_{folder_name}")
 
-    # Render files
+    # Render files as a single Markdown block per folder. Per-file
+    # st.columns triples the widget count and rerun payload; one markdown
+    # call per folder keeps widgets at O(folders), with the per-file
+    # preview/download widgets rendered only on request.
     if '__files__' in tree:
-        for file_info in sorted(tree['__files__'], key=lambda x: x['name']):
-            file_name = file_info['name']
-            file_path = file_info['path']
-
-            # Use tight columns for close icon alignment
-            col1, col2, col3 = st.columns([10, 1, 1])
-            with col1:
-                st.markdown(f"{indent}📄 {file_name}")
-            with col2:
-                create_preview_button(file_path, key_suffix=f"{key_prefix}_{file_name}")
-            with col3:
-                create_download_button(
-                    file_path,
-                    "⬇️",
-                    key_suffix=f"{key_prefix}_{file_name}"
-                )
+        files = sorted(tree['__files__'], key=lambda x: x['name'])
+
+        st.markdown("  \n".join(
+            f"{indent}📄 {create_file_link(f['path'], f['name'])}" for f in files
+        ))
+
+        if st.checkbox(
+            "⚙️ File actions",
+            key=f"actions_{key_prefix}",
+            help="Show preview and download buttons for these files"
+        ):
+            for file_info in files:
+                file_name = file_info['name']
+                file_path = file_info['path']
+
+                # Use tight columns for close icon alignment
+                col1, col2, col3 = st.columns([10, 1, 1])
+                with col1:
+                    st.markdown(f"{indent}📄 {file_name}")
+                with col2:
+                    create_preview_button(file_path, key_suffix=f"{key_prefix}_{file_name}")
+                with col3:
+                    create_download_button(
+                        file_path,
+                        "⬇️",
+                        key_suffix=f"{key_prefix}_{file_name}"
+                    )
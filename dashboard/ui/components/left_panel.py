@@ -8,9 +8,20 @@ from datetime import datetime
 from typing import List, Dict, Any
 
 from rfq_tracker.db_manager import DBManager
-from dashboard.data.queries import fetch_projects, fetch_all_suppliers
-from dashboard.logic.processing import filter_projects, sort_projects
-from dashboard.utils.helpers import run_manual_refresh
+from dashboard.data.queries import (
+    fetch_projects,
+    fetch_projects_page,
+    fetch_all_suppliers,
+)
+from dashboard.utils.helpers import start_manual_refresh, poll_manual_refresh
+
+# Map the sort selectbox labels to (field, direction) for the Mongo query
+SORT_OPTIONS = {
+    "Project Number (Descending)": ("project_number", -1),
+    "Project Number (Ascending)": ("project_number", 1),
+    "Last Scanned (Newest First)": ("last_scanned", -1),
+    "Last Scanned (Oldest First)": ("last_scanned", 1),
+}
 
 
 def render_left_panel(left_col, db_manager: DBManager, all_projects: List[Dict[str, Any]], all_suppliers: List[str]):
@@ -20,17 +31,31 @@ def render_left_panel(left_col, db_manager: DBManager, all_projects: List[Dict[s
     Args:
         left_col: Streamlit column object
         db_manager: Database manager instance
-        all_projects: List of all project dictionaries
+        all_projects: List of all project dictionaries (used upstream for the
+            empty-database check; the panel itself queries per page)
         all_suppliers: List of all supplier names
     """
     with left_col:
-        # Manual Refresh Button at top
-        if st.button("🔄 Refresh Data", key="refresh_btn_left", use_container_width=True):
-            with st.spinner("🔄 Refreshing data..."):
-                success, message = run_manual_refresh()
+        # Manual Refresh Button at top. The crawler runs as a background
+        # process; each rerun polls it instead of blocking the UI.
+        refresh_proc = st.session_state.get('refresh_proc')
+        if refresh_proc is not None:
+            result = poll_manual_refresh(refresh_proc)
+            if result is None:
+                # Still running: show the status and let the rest of the
+                # dashboard render normally; app.py schedules the next poll
+                # rerun after all panels are drawn
+                st.info("🔄 Refreshing data in background...")
+            else:
+                st.session_state.refresh_proc = None
+                success, message = result
                 st.session_state.last_refresh_time = datetime.now()
                 fetch_projects.clear()
-                fetch_supplier_data.clear()
+                fetch_projects_page.clear()
+                fetch_supplier_names.clear()
+                fetch_single_supplier_data.clear()
+                fetch_project_statistics.clear()
+                fetch_partner_statistics.clear()
                 fetch_all_suppliers.clear()
 
                 if success:
@@ -40,6 +65,9 @@ def render_left_panel(left_col, db_manager: DBManager, all_projects: List[Dict[s
                     st.error(f"⏱️ {message}")
                 else:
                     st.warning(f"⚠️ {message}")
+        elif st.button("🔄 Refresh Data", key="refresh_btn_left", use_container_width=True):
+            st.session_state.refresh_proc = start_manual_refresh()
+            st.rerun()
 
         st.divider()
 
@@ -101,39 +129,43 @@ def render_left_panel(left_col, db_manager: DBManager, all_projects: List[Dict[s
         # Sort options (always visible)
         sort_option = st.selectbox(
             "Sort by",
-            [
-                "Project Number (Descending)",
-                "Project Number (Ascending)",
-                "Last Scanned (Newest First)",
-                "Last Scanned (Oldest First)"
-            ],
+            list(SORT_OPTIONS.keys()),
             key="sort_select"
         )
+        sort_field, sort_dir = SORT_OPTIONS[sort_option]
 
-        # Filter and sort projects
-        filtered_projects = filter_projects(
-            all_projects,
-            search_term,
-            selected_suppliers,
-            st.session_state.date_range_start,
-            st.session_state.date_range_end,
-            db_manager
+        # Filter/sort/paginate server-side; MongoDB uses the project_number
+        # index instead of Python rescanning the full list every rerun
+        date_start_iso = (
+            st.session_state.date_range_start.isoformat()
+            if st.session_state.date_range_start else None
+        )
+        date_end_iso = (
+            st.session_state.date_range_end.isoformat()
+            if st.session_state.date_range_end else None
         )
-        sorted_projects = sort_projects(filtered_projects, sort_option)
+        supplier_filter = tuple(selected_suppliers)
 
-        # Pagination setup
+        # Pagination: one $facet aggregation returns the page and the total
+        # count together instead of two round trips
         ITEMS_PER_PAGE = 15
-        total_projects = len(sorted_projects)
+        start_idx = (st.session_state.current_page - 1) * ITEMS_PER_PAGE
+        paginated_projects, total_projects = fetch_projects_page(
+            db_manager, search_term, supplier_filter, date_start_iso, date_end_iso,
+            sort_field, sort_dir, start_idx, ITEMS_PER_PAGE
+        )
         total_pages = max(1, (total_projects + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE)
 
-        # Reset to page 1 if current page is out of bounds
+        # Reset to page 1 if filters shrank the result under the current page
         if st.session_state.current_page > total_pages:
             st.session_state.current_page = 1
+            start_idx = 0
+            paginated_projects, total_projects = fetch_projects_page(
+                db_manager, search_term, supplier_filter, date_start_iso, date_end_iso,
+                sort_field, sort_dir, 0, ITEMS_PER_PAGE
+            )
 
-        # Calculate pagination indices
-        start_idx = (st.session_state.current_page - 1) * ITEMS_PER_PAGE
         end_idx = min(start_idx + ITEMS_PER_PAGE, total_projects)
-        paginated_projects = sorted_projects[start_idx:end_idx]
 
         # Display filter stats
         st.caption(f"Showing {start_idx + 1}-{end_idx} of {total_projects} projects (Page {st.session_state.current_page}/{total_pages})")
@@ -189,5 +221,10 @@ def render_left_panel(left_col, db_manager: DBManager, all_projects: List[Dict[s
                     st.rerun()
 
 
-# Import fetch_supplier_data to clear cache
-from dashboard.data.queries import fetch_supplier_data
+# Import supplier fetchers to clear their caches on refresh
+from dashboard.data.queries import (
+    fetch_supplier_names,
+    fetch_single_supplier_data,
+    fetch_project_statistics,
+    fetch_partner_statistics,
+)
@@ -6,7 +6,7 @@ Contains supplier selection list.
 import streamlit as st
 
 from rfq_tracker.db_manager import DBManager
-from dashboard.data.queries import fetch_supplier_data
+from dashboard.data.queries import fetch_supplier_names, fetch_partner_statistics
 
 
 def render_right_panel(right_col, db_manager: DBManager):
@@ -21,13 +21,24 @@ def render_right_panel(right_col, db_manager: DBManager):
         if st.session_state.selected_project:
             st.markdown("### 🏢 Suppliers")
 
-            # Fetch supplier data
+            # Only the names are needed for the selection list
             with st.spinner("Loading..."):
-                supplier_data = fetch_supplier_data(db_manager, st.session_state.selected_project['project_number'])
+                supplier_names = fetch_supplier_names(
+                    db_manager, st.session_state.selected_project['project_number']
+                )
+
+            if supplier_names:
+                # Per-supplier counts come back as a dict keyed by name, so
+                # labelling each option is an O(1) lookup
+                partner_stats = fetch_partner_statistics(
+                    db_manager, st.session_state.selected_project['project_number']
+                )
 
-            if supplier_data:
-                # Create radio buttons for supplier selection
-                supplier_names = [d['supplier']['supplier_name'] for d in supplier_data]
+                def _supplier_label(name: str) -> str:
+                    stats = partner_stats.get(name)
+                    if not stats:
+                        return name
+                    return f"{name} ({stats['sent_count']} sent / {stats['received_count']} received)"
 
                 # Find index of currently selected supplier
                 try:
@@ -39,6 +50,7 @@ def render_right_panel(right_col, db_manager: DBManager):
                     "Select Supplier",
                     supplier_names,
                     index=default_index,
+                    format_func=_supplier_label,
                     label_visibility="collapsed",
                     key="supplier_radio"
                 )
@@ -3,22 +3,46 @@ Helper utility functions for RFQ Dashboard.
 """
 
 import sys
+import time
 import logging
 import platform
 import subprocess
+import tempfile
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
 
+# Platform never changes at runtime; resolve the file URL prefix once
+_FILE_URL_PREFIX = 'file:///' if platform.system() == 'Windows' else 'file://'
 
+
+@lru_cache(maxsize=16384)
+def _resolved_path(file_path: str) -> str:
+    """Absolute, normalized form of a path (one resolve syscall per path)."""
+    return str(Path(file_path).resolve())
+
+
+@lru_cache(maxsize=4096)
 def format_timestamp(timestamp_str: str) -> str:
-    """Format ISO 8601 timestamp to human-readable format."""
+    """
+    Format ISO 8601 timestamp to human-readable format.
+
+    Cached: the same last_scanned/date strings are re-formatted on every
+    Streamlit rerun, so repeat calls skip the fromisoformat/strftime work.
+    """
     try:
-        dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+        # Z only ever appears as the suffix, so an endswith check beats
+        # replace() scanning the whole string on every call
+        if timestamp_str.endswith('Z'):
+            normalized = timestamp_str[:-1] + '+00:00'
+        else:
+            normalized = timestamp_str
+        dt = datetime.fromisoformat(normalized)
         return dt.strftime('%Y-%m-%d %H:%M:%S')
-    except:
+    except (ValueError, AttributeError, TypeError):
         return timestamp_str
 
 
@@ -34,78 +58,109 @@ def create_file_link(file_path: str, link_text: str = "Open") -> str:
         Markdown link string
     """
     try:
-        # Convert to absolute path and normalize
-        abs_path = str(Path(file_path).resolve())
+        # URL encode the absolute, normalized path (resolve cached per path)
+        encoded_path = quote(_resolved_path(file_path).replace('\\', '/'))
 
-        # URL encode the path
-        encoded_path = quote(abs_path.replace('\\', '/'))
-
-        # Platform-specific file URL format
-        if platform.system() == 'Windows':
-            file_url = f"file:///{encoded_path}"
-        else:
-            file_url = f"file://{encoded_path}"
-
-        return f"[{link_text}]({file_url})"
+        return f"[{link_text}]({_FILE_URL_PREFIX}{encoded_path})"
     except Exception as e:
         logger.error(f"Error creating file link for {file_path}: {e}")
         return f"⚠️ {link_text} (path error)"
 
 
-def run_startup_crawler() -> tuple[bool, str]:
+def run_startup_crawler(db_manager=None) -> tuple[bool, str]:
     """
-    Run the crawler on dashboard startup to refresh data.
+    Run the crawler in-process on dashboard startup to refresh data.
+
+    Spawning a subprocess paid full interpreter startup and re-imported
+    pymongo for a one-shot crawl; calling the crawler directly skips that
+    and can reuse the dashboard's already-open MongoClient.
+
+    Args:
+        db_manager: Optional connected DBManager whose MongoClient should
+            be shared (the crawler closes its own connection afterwards,
+            a shared client is left open).
 
     Returns:
         Tuple of (success: bool, message: str)
     """
     try:
-        # Run crawler with 5 minute timeout
-        result = subprocess.run(
-            [sys.executable, "run_crawler.py"],
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minutes
+        # Imported here so the helpers module stays light for non-crawl paths
+        from dashboard.config import load_config
+        from rfq_tracker.crawler import RFQCrawler
+        from rfq_tracker.db_manager import DBManager
+
+        config = load_config()
+        crawler_db = DBManager(
+            config['mongo_uri'],
+            config['mongo_db'],
+            client=db_manager.client if db_manager is not None else None
         )
-
-        if result.returncode == 0:
-            return True, "Data refreshed successfully"
-        else:
-            error_msg = result.stderr if result.stderr else "Unknown error"
-            logger.warning(f"Crawler completed with errors: {error_msg}")
-            return False, f"Crawler completed with warnings: {error_msg[:100]}"
-    except subprocess.TimeoutExpired:
-        logger.error("Crawler timed out after 5 minutes")
-        return False, "Crawler timed out after 5 minutes"
+        crawler = RFQCrawler(config=config, db_manager=crawler_db)
+        crawler.crawl()
+        return True, "Data refreshed successfully"
     except Exception as e:
         logger.error(f"Error running crawler: {e}")
         return False, f"Error refreshing data: {str(e)[:100]}"
 
 
-def run_manual_refresh() -> tuple[bool, str]:
+def start_manual_refresh() -> subprocess.Popen:
     """
-    Run manual refresh synchronously (not in background).
+    Launch the crawler as a background process for a manual refresh.
+
+    The caller polls the returned process with poll_manual_refresh() on
+    each rerun, so the UI is never blocked waiting for the crawl.
+
+    stderr goes to an unbuffered temp file rather than a pipe: nothing
+    drains a pipe while the crawler runs, and its INFO logging would fill
+    the pipe buffer and deadlock the crawl on any realistically sized tree.
 
     Returns:
-        Tuple of (success: bool, message: str)
+        The crawler subprocess
     """
+    stderr_file = tempfile.TemporaryFile(mode="w+")
+    proc = subprocess.Popen(
+        [sys.executable, "run_crawler.py"],
+        stdout=subprocess.DEVNULL,
+        stderr=stderr_file,
+        text=True
+    )
+    proc.started_at = time.monotonic()
+    proc.stderr_file = stderr_file
+    return proc
+
+
+def _collect_stderr(proc: subprocess.Popen) -> str:
+    """Read and release the temp file holding a finished refresh's stderr."""
     try:
-        result = subprocess.run(
-            [sys.executable, "run_crawler.py"],
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minutes
-        )
+        proc.stderr_file.seek(0)
+        return proc.stderr_file.read()
+    finally:
+        proc.stderr_file.close()
 
-        if result.returncode == 0:
-            return True, "Data refreshed successfully"
-        else:
-            error_msg = result.stderr if result.stderr else "Unknown error"
-            logger.warning(f"Manual refresh completed with errors: {error_msg}")
-            return False, f"Completed with warnings: {error_msg[:100]}"
-    except subprocess.TimeoutExpired:
-        logger.error("Manual refresh timed out")
-        return False, "Refresh timed out after 5 minutes"
-    except Exception as e:
-        logger.error(f"Manual refresh error: {e}")
-        return False, f"Error: {str(e)[:100]}"
+
+def poll_manual_refresh(proc: subprocess.Popen) -> tuple[bool, str] | None:
+    """
+    Check a background refresh without blocking.
+
+    Args:
+        proc: Process returned by start_manual_refresh()
+
+    Returns:
+        None while still running, else tuple of (success: bool, message: str)
+    """
+    if proc.poll() is None:
+        if time.monotonic() - proc.started_at > 300:  # 5 minutes
+            proc.kill()
+            proc.wait()  # reap, or the killed crawler lingers as a zombie
+            _collect_stderr(proc)
+            logger.error("Manual refresh timed out")
+            return False, "Refresh timed out after 5 minutes"
+        return None
+
+    error_msg = _collect_stderr(proc)
+    if proc.returncode == 0:
+        return True, "Data refreshed successfully"
+
+    error_msg = error_msg or "Unknown error"
+    logger.warning(f"Manual refresh completed with errors: {error_msg}")
+    return False, f"Completed with warnings: {error_msg[:100]}"
@@ -2,10 +2,14 @@
 Core crawler logic for scanning RFQ metadata from project directories.
 """
 
+import os
+import re
 import sys
 import json
 import logging
 import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import List, Dict, Any
@@ -15,6 +19,21 @@ from .db_manager import DBManager
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _scan_rfq_folders(project_path: str, dir_mtime_ns: int, names_lower: frozenset) -> tuple:
+    """List RFQ folder paths under a project root, cached per (path, mtime).
+
+    The mtime key means adding or removing an entry in the project root
+    invalidates the cached listing automatically. os.scandir hands back
+    entry type info from the readdir call itself, so no stat per entry.
+    """
+    with os.scandir(project_path) as entries:
+        return tuple(
+            entry.path for entry in entries
+            if entry.is_dir() and entry.name.lower() in names_lower
+        )
+
+
 class RFQCrawler:
     """Main crawler class for extracting RFQ metadata from project folders."""
 
@@ -30,11 +49,20 @@ class RFQCrawler:
         self.root_path = Path(config.get("root_path", "."))
         self.filter_tags = config.get("filter_tags", ["Template", "archive"])
         self.file_filter_tags = config.get("file_filter_tags", [".db"])
+        # Precompiled filter forms: one C-level regex scan replaces the
+        # per-tag substring loop, and endswith takes the suffix tuple direct
+        self._skip_folder_re = (
+            re.compile("|".join(map(re.escape, self.filter_tags)), re.IGNORECASE)
+            if self.filter_tags else None
+        )
+        self._skip_file_suffixes = tuple(ext.lower() for ext in self.file_filter_tags)
         self.db_manager = db_manager
         self.dry_run = dry_run
 
-        # RFQ folder names to search for (case-insensitive)
+        # RFQ folder names to search for (case-insensitive); the lowered
+        # frozenset turns the per-directory match into one hash lookup
         self.rfq_folder_names = ["RFQ", "Supplier RFQ", "Contractor", "1-RFQ"]
+        self._rfq_names_lower = frozenset(name.lower() for name in self.rfq_folder_names)
 
     def is_project_folder(self, folder_name: str) -> bool:
         """Check if folder name consists entirely of digits."""
@@ -42,24 +70,26 @@ class RFQCrawler:
 
     def should_skip_folder(self, folder_name: str) -> bool:
         """Check if folder should be skipped based on filter tags."""
-        return any(tag.lower() in folder_name.lower() for tag in self.filter_tags)
+        return bool(self._skip_folder_re and self._skip_folder_re.search(folder_name))
 
     def should_skip_file(self, file_name: str) -> bool:
         """Check if a file should be skipped based on its extension."""
-        return any(file_name.lower().endswith(ext) for ext in self.file_filter_tags)
+        return file_name.lower().endswith(self._skip_file_suffixes)
 
     def find_rfq_folders(self, project_path: Path) -> List[Path]:
-        """Find RFQ-related folders within a project folder."""
-        rfq_folders = []
+        """Find RFQ-related folders within a project folder.
+
+        Results are memoized on the directory's mtime, so repeated crawls
+        in one process (startup crawl plus manual refreshes) skip the
+        enumeration for project roots that have not changed.
+        """
         try:
-            for item in project_path.iterdir():
-                if item.is_dir():
-                    if any(rfq_name.lower() == item.name.lower() for rfq_name in self.rfq_folder_names):
-                        rfq_folders.append(item)
-                        logger.debug(f"Found RFQ folder: {item}")
+            mtime_ns = os.stat(project_path).st_mtime_ns
+            folder_paths = _scan_rfq_folders(str(project_path), mtime_ns, self._rfq_names_lower)
         except FileNotFoundError:
             logger.warning(f"Project path {project_path} not found during RFQ folder search.")
-        return rfq_folders
+            return []
+        return [Path(p) for p in folder_paths]
 
     def get_file_creation_time(self, file_path: Path) -> str:
         """Get file creation time as an ISO 8601 UTC string."""
@@ -81,9 +111,12 @@ class RFQCrawler:
         Returns:
             SHA-256 hash string representing the folder's contents
         """
-        file_hashes = []
+        folder_digest = hashlib.sha256()
+        hashed_any = False
 
-        # Collect all files recursively
+        # Walk files in sorted order, folding each relative path and file
+        # digest straight into the folder digest — no per-file dict list and
+        # no JSON serialization pass over it
         for file_path in sorted(folder_path.rglob("*")):
             if file_path.is_file() and not self.should_skip_file(file_path.name):
                 try:
@@ -94,22 +127,18 @@ class RFQCrawler:
                         for chunk in iter(lambda: f.read(8192), b''):
                             sha256.update(chunk)
 
-                    # Store relative path + hash
-                    relative_path = str(file_path.relative_to(folder_path))
-                    file_hashes.append({
-                        'path': relative_path,
-                        'hash': sha256.hexdigest()
-                    })
+                    folder_digest.update(str(file_path.relative_to(folder_path)).encode('utf-8'))
+                    folder_digest.update(b'\0')
+                    folder_digest.update(sha256.digest())
+                    hashed_any = True
                 except Exception as e:
                     logger.warning(f"Could not hash file {file_path}: {e}")
                     continue
 
-        # Serialize to JSON and hash the entire structure
-        if not file_hashes:
+        if not hashed_any:
             return hashlib.sha256(b'').hexdigest()  # Empty folder hash
 
-        content_json = json.dumps(file_hashes, sort_keys=True)
-        return hashlib.sha256(content_json.encode('utf-8')).hexdigest()
+        return folder_digest.hexdigest()
 
     def process_submission_folder(self, folder_path: Path, project_number: str,
                                   supplier_name: str, folder_type: str) -> List[Dict[str, Any]]:
@@ -127,35 +156,40 @@ class RFQCrawler:
         """
         submissions = []
 
-        if not folder_path.exists():
+        # Iterate through submission folders; a missing Sent/Received folder
+        # surfaces as FileNotFoundError from scandir instead of a separate
+        # exists() stat
+        try:
+            entries = os.scandir(folder_path)
+        except FileNotFoundError:
             return submissions
 
-        # Iterate through submission folders
-        for submission_folder in folder_path.iterdir():
-            if submission_folder.is_dir():
-                # Skip filtered folders
-                if self.should_skip_folder(submission_folder.name):
-                    continue
-
-                # Compute content hash for version tracking
-                content_hash = self.compute_content_hash(submission_folder)
-
-                submission = {
-                    "project_number": project_number,
-                    "supplier_name": supplier_name,
-                    "type": folder_type,  # "sent" or "received"
-                    "folder_name": submission_folder.name,
-                    "folder_path": str(submission_folder.resolve()),
-                    "date": self.get_file_creation_time(submission_folder),
-                    "content_hash": content_hash,
-                    "files": [
-                        str(f.resolve()) for f in submission_folder.rglob("*")
-                        if f.is_file() and not self.should_skip_file(f.name)
-                    ]
-                }
-
-                submissions.append(submission)
-                logger.debug(f"Found {len(submission['files'])} files in {folder_type} folder {submission_folder.name} (hash: {content_hash[:8]}...)")
+        with entries:
+            submission_folders = [
+                Path(entry.path) for entry in entries
+                if entry.is_dir() and not self.should_skip_folder(entry.name)
+            ]
+
+        for submission_folder in submission_folders:
+            # Compute content hash for version tracking
+            content_hash = self.compute_content_hash(submission_folder)
+
+            submission = {
+                "project_number": project_number,
+                "supplier_name": supplier_name,
+                "type": folder_type,  # "sent" or "received"
+                "folder_name": submission_folder.name,
+                "folder_path": str(submission_folder.resolve()),
+                "date": self.get_file_creation_time(submission_folder),
+                "content_hash": content_hash,
+                "files": [
+                    str(f.resolve()) for f in submission_folder.rglob("*")
+                    if f.is_file() and not self.should_skip_file(f.name)
+                ]
+            }
+
+            submissions.append(submission)
+            logger.debug(f"Found {len(submission['files'])} files in {folder_type} folder {submission_folder.name} (hash: {content_hash[:8]}...)")
 
         logger.info(f"Found {len(submissions)} {folder_type} submissions in {folder_path}")
         return submissions
@@ -207,21 +241,38 @@ class RFQCrawler:
 
         all_suppliers, all_submissions = [], []
 
+        supplier_dirs = []
         for rfq_folder in self.find_rfq_folders(project_folder):
-            # Check for "Supplier RFQ Quotes" intermediate layer (new structure)
+            # Check for "Supplier RFQ Quotes" intermediate layer (new
+            # structure); is_dir covers the exists check in one stat
             supplier_quotes_folder = rfq_folder / "Supplier RFQ Quotes"
-            if supplier_quotes_folder.exists() and supplier_quotes_folder.is_dir():
+            if supplier_quotes_folder.is_dir():
                 # New structure: navigate through intermediate layer
-                supplier_folders = supplier_quotes_folder.iterdir()
+                listing_dir = supplier_quotes_folder
             else:
                 # Legacy structure: suppliers directly under RFQ folder
-                supplier_folders = rfq_folder.iterdir()
-
-            for supplier_folder in supplier_folders:
-                if supplier_folder.is_dir() and not self.should_skip_folder(supplier_folder.name):
-                    result = self.process_supplier_folder(supplier_folder, project_number)
-                    all_suppliers.append(result["supplier"])
-                    all_submissions.extend(result["submissions"])
+                listing_dir = rfq_folder
+
+            try:
+                with os.scandir(listing_dir) as entries:
+                    supplier_dirs.extend(
+                        Path(entry.path) for entry in entries
+                        if entry.is_dir() and not self.should_skip_folder(entry.name)
+                    )
+            except FileNotFoundError:
+                continue
+
+        # Suppliers are processed serially here; crawl() already overlaps
+        # whole projects on a thread pool, and project-level tasks are
+        # coarse enough to hide I/O latency without nesting pools.
+        results = [
+            self.process_supplier_folder(folder, project_number)
+            for folder in supplier_dirs
+        ]
+
+        for result in results:
+            all_suppliers.append(result["supplier"])
+            all_submissions.extend(result["submissions"])
 
         return {
             "project": project_doc,
@@ -242,22 +293,42 @@ class RFQCrawler:
         logger.info(f"Folder filter tags: {self.filter_tags}")
         logger.info(f"File filter tags: {self.file_filter_tags}")
 
-        project_count = 0
-        for item in self.root_path.iterdir():
-            if item.is_dir():
-                if self.should_skip_folder(item.name):
-                    logger.debug(f"Skipping filtered folder: {item.name}")
+        # One readdir pass over the root; entry type comes back with the
+        # listing so no per-entry stat is needed
+        with os.scandir(self.root_path) as entries:
+            project_folders = []
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                if self.should_skip_folder(entry.name):
+                    logger.debug(f"Skipping filtered folder: {entry.name}")
                     continue
+                if self.is_project_folder(entry.name):
+                    project_folders.append(Path(entry.path))
 
-                if self.is_project_folder(item.name):
-                    project_data = self.process_project_folder(item)
-                    if self.dry_run:
-                        logger.info(f"Dry Run: Would save data for project {project_data['project']['project_number']}")
-                        logger.info(f"Project: {json.dumps(project_data['project'], indent=2)}")
-                        logger.info(f"Suppliers: {json.dumps(project_data['suppliers'], indent=2)}")
-                        logger.info(f"Submissions: {json.dumps(project_data['submissions'], indent=2)}")
-                    else:
-                        self.db_manager.save_project_data(project_data)
+        # Project scans are I/O bound (readdir/stat/hashing all release the
+        # GIL), so overlap them with threads and save each project as its
+        # scan completes. Dry runs stay serial so their logs stay ordered.
+        project_count = 0
+        if self.dry_run or len(project_folders) <= 1:
+            for item in project_folders:
+                project_data = self.process_project_folder(item)
+                if self.dry_run:
+                    logger.info(f"Dry Run: Would save data for project {project_data['project']['project_number']}")
+                    logger.info(f"Project: {json.dumps(project_data['project'], indent=2)}")
+                    logger.info(f"Suppliers: {json.dumps(project_data['suppliers'], indent=2)}")
+                    logger.info(f"Submissions: {json.dumps(project_data['submissions'], indent=2)}")
+                else:
+                    self.db_manager.save_project_data(project_data)
+                project_count += 1
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(project_folders))) as executor:
+                futures = [
+                    executor.submit(self.process_project_folder, item)
+                    for item in project_folders
+                ]
+                for future in as_completed(futures):
+                    self.db_manager.save_project_data(future.result())
                     project_count += 1
 
         logger.info(f"Crawl complete. Processed {project_count} projects.")
@@ -1,23 +1,51 @@
 import sys
 import logging
-from pymongo import MongoClient, UpdateOne
+from pymongo import IndexModel, InsertOne, MongoClient, UpdateOne
 from pymongo.errors import ConnectionFailure
+from pymongo.write_concern import WriteConcern
 
 logger = logging.getLogger(__name__)
 
 class DBManager:
     """Manages all interactions with the MongoDB database."""
 
-    def __init__(self, mongo_uri: str, db_name: str):
+    def __init__(self, mongo_uri: str, db_name: str, write_concern: WriteConcern = None,
+                 client: MongoClient = None):
+        """
+        Args:
+            mongo_uri: MongoDB connection URI.
+            db_name: Name of the database to use.
+            write_concern: Optional WriteConcern for all writes. The crawler
+                passes a relaxed concern (its writes are idempotent via
+                content hashes); the dashboard keeps the default for
+                read-your-writes semantics.
+            client: Optional pre-built MongoClient to share. MongoClient is
+                thread-safe and carries its own pool and monitor threads, so
+                multiple DBManagers in one process should reuse one. A shared
+                client is not closed by close().
+        """
         self.mongo_uri = mongo_uri
         self.db_name = db_name
-        self.client = None
+        self.write_concern = write_concern
+        self.client = client
+        self._owns_client = client is None
         self.db = None
+        # Known submission keys per project, seeded lazily from the DB.
+        # Steady-state re-crawls mostly hit this cache and never probe Mongo.
+        self._hash_cache = {}
 
     def connect(self):
         """Connect to the MongoDB instance and ensure indexes exist."""
         try:
-            self.client = MongoClient(self.mongo_uri)
+            # Compress the wire protocol; submission docs (hashes, paths,
+            # folder metadata) compress well. Falls back to uncompressed if
+            # the server supports none of these.
+            if self.client is None:
+                self.client = MongoClient(
+                    self.mongo_uri,
+                    compressors="zstd,snappy,zlib",
+                    zlibCompressionLevel=6
+                )
             # The ismaster command is cheap and does not require auth.
             # Skip for mongomock which doesn't support this command
             try:
@@ -25,22 +53,56 @@ class DBManager:
             except Exception:
                 # Mongomock or other test environments may not support ismaster
                 pass
-            self.db = self.client[self.db_name]
-            logger.info(f"Successfully connected to MongoDB database '{self.db_name}'")
+            if self.write_concern is not None:
+                self.db = self.client.get_database(self.db_name, write_concern=self.write_concern)
+            else:
+                self.db = self.client[self.db_name]
+            logger.info("Successfully connected to MongoDB database '%s'", self.db_name)
             self._ensure_indexes()
         except ConnectionFailure as e:
-            logger.error(f"Failed to connect to MongoDB: {e}")
+            logger.error("Failed to connect to MongoDB: %s", e)
             sys.exit(1)
 
     def _ensure_indexes(self):
-        """Ensure all required indexes exist for efficient queries and upserts."""
-        self.db.projects.create_index("project_number", unique=True)
-        self.db.suppliers.create_index([("project_number", 1), ("supplier_name", 1)], unique=True)
-        # Unified submissions collection with type field
-        self.db.submissions.create_index([("project_number", 1), ("supplier_name", 1), ("type", 1)])
-        self.db.submissions.create_index([("project_number", 1), ("supplier_name", 1), ("folder_name", 1), ("content_hash", 1)], unique=True)
-        # Index for efficient version lookups
-        self.db.submissions.create_index([("project_number", 1), ("supplier_name", 1), ("folder_name", 1), ("date", -1)])
+        """
+        Ensure all required indexes exist for efficient queries and upserts.
+
+        One createIndexes command per collection; MongoDB 4.2+ builds
+        indexes without blocking reads/writes, so startup isn't gated on a
+        cold instance finishing the builds.
+        """
+        self.db.projects.create_indexes([
+            IndexModel("project_number", unique=True)
+        ])
+        self.db.suppliers.create_indexes([
+            IndexModel([("project_number", 1), ("supplier_name", 1)], unique=True)
+        ])
+        # Submission indexes, created in one round trip. The old
+        # (project_number, supplier_name, type) index was a prefix of these
+        # and only added write amplification on every upsert.
+        self.db.submissions.create_indexes([
+            IndexModel(
+                [("project_number", 1), ("supplier_name", 1), ("folder_name", 1), ("content_hash", 1)],
+                unique=True
+            ),
+            # Version lookups; partial so docs without a date stay out of it
+            IndexModel(
+                [("project_number", 1), ("supplier_name", 1), ("folder_name", 1), ("date", -1)],
+                partialFilterExpression={"date": {"$exists": True}}
+            ),
+            # Dashboard per-supplier view: find {project, supplier} sorted by
+            # date desc becomes an index-backed top-K scan (folder_name sits
+            # between the prefix and date in the index above, so that one
+            # can't serve this sort)
+            IndexModel(
+                [("project_number", 1), ("supplier_name", 1), ("date", -1)]
+            ),
+            # Project statistics: $match on project_number then $group over
+            # type/supplier_name reads entirely from this index
+            IndexModel(
+                [("project_number", 1), ("type", 1), ("supplier_name", 1)]
+            ),
+        ])
         logger.info("Database indexes ensured.")
 
     def save_project_data(self, data: dict):
@@ -53,11 +115,29 @@ class DBManager:
             return
 
         try:
-            # Upsert project
+            # Upsert project. $set only the fields that change so the oplog
+            # entry stays small; the key itself is written once on insert.
             if data["project"]:
-                self.db.projects.replace_one(
-                    {"project_number": data["project"]["project_number"]},
-                    data["project"],
+                project = data["project"]
+                mutable = {k: v for k, v in project.items() if k != "project_number"}
+                # Precompute the dashboard's contacted/responded counts while
+                # the full submission list is in hand; reading them back is
+                # then a find_one on the project instead of an aggregation
+                crawled = data.get("submissions") or []
+                mutable["stats"] = {
+                    "contacted_count": len({
+                        s["supplier_name"] for s in crawled if s.get("type") == "sent"
+                    }),
+                    "responded_count": len({
+                        s["supplier_name"] for s in crawled if s.get("type") == "received"
+                    }),
+                }
+                self.db.projects.update_one(
+                    {"project_number": project["project_number"]},
+                    {
+                        "$set": mutable,
+                        "$setOnInsert": {"project_number": project["project_number"]}
+                    },
                     upsert=True
                 )
 
@@ -72,36 +152,71 @@ class DBManager:
                 ]
                 self.db.suppliers.bulk_write(requests)
 
-            # Content-aware versioning for submissions
+            # Content-aware versioning for submissions. The per-project cache
+            # of known (supplier, folder, content_hash) keys is seeded from
+            # one projected query on first touch; after that, re-crawls of
+            # unchanged projects skip the existence probe entirely.
             if data["submissions"]:
-                for sub in data["submissions"]:
-                    # Check if this exact content already exists
-                    existing = self.db.submissions.find_one({
-                        "project_number": sub["project_number"],
-                        "supplier_name": sub["supplier_name"],
-                        "folder_name": sub["folder_name"],
-                        "content_hash": sub["content_hash"]
-                    })
-
-                    if existing:
-                        # Content unchanged - optionally update last_checked timestamp
-                        self.db.submissions.update_one(
-                            {"_id": existing["_id"]},
-                            {"$set": {"last_checked": sub["date"]}}
+                submissions = data["submissions"]
+                # Bind once; each Database.__getattr__ builds a fresh
+                # Collection object
+                submissions_coll = self.db.submissions
+                # Pull the key columns out of the dicts once so the partition
+                # below works on plain tuples instead of re-hashing dict
+                # fields per document.
+                keys = [
+                    (s["supplier_name"], s["folder_name"], s.get("content_hash"))
+                    for s in submissions
+                ]
+                for pn in {s["project_number"] for s in submissions}:
+                    if pn not in self._hash_cache:
+                        existing = submissions_coll.find(
+                            {"project_number": pn},
+                            {"supplier_name": 1, "folder_name": 1, "content_hash": 1}
                         )
-                        logger.debug(f"Skipped duplicate: {sub['folder_name']} (hash: {sub['content_hash'][:8]}...)")
+                        self._hash_cache[pn] = {
+                            (e["supplier_name"], e["folder_name"], e.get("content_hash"))
+                            for e in existing
+                        }
+
+                operations = []
+                # Keys inserted in this batch; merged into the cache only
+                # after the bulk_write succeeds, so a failed batch is retried
+                # on the next crawl instead of being cached as "known"
+                inserted = set()
+                for sub, key in zip(submissions, keys):
+                    pn = sub["project_number"]
+                    if key in self._hash_cache[pn] or (pn, key) in inserted:
+                        # Content unchanged - refresh the last_checked stamp
+                        # (matched on the unique-index fields)
+                        operations.append(UpdateOne(
+                            {
+                                "project_number": pn,
+                                "supplier_name": sub["supplier_name"],
+                                "folder_name": sub["folder_name"],
+                                "content_hash": sub.get("content_hash"),
+                            },
+                            {"$set": {"last_checked": sub.get("date")}}
+                        ))
+                        logger.debug("Skipped duplicate: %s", sub["folder_name"])
                     else:
                         # New version - insert it
-                        self.db.submissions.insert_one(sub)
-                        logger.debug(f"Inserted new version: {sub['folder_name']} (hash: {sub['content_hash'][:8]}...)")
+                        operations.append(InsertOne(sub))
+                        inserted.add((pn, key))
+                        logger.debug("Inserted new version: %s", sub["folder_name"])
+
+                if operations:
+                    submissions_coll.bulk_write(operations, ordered=False)
+                for pn, key in inserted:
+                    self._hash_cache[pn].add(key)
 
-            logger.info(f"Processed data for project {data['project']['project_number']}")
+            logger.info("Processed data for project %s", data["project"]["project_number"])
 
         except Exception as e:
-            logger.error(f"Error saving to MongoDB for project {data.get('project', {}).get('project_number')}: {e}")
+            logger.error("Error saving to MongoDB for project %s: %s", data.get("project", {}).get("project_number"), e)
 
     def close(self):
-        """Close the MongoDB connection."""
-        if self.client:
+        """Close the MongoDB connection (unless the client is shared)."""
+        if self.client and self._owns_client:
             self.client.close()
             logger.info("MongoDB connection closed.")
\ No newline at end of file
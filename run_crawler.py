@@ -7,13 +7,12 @@ import sys
 import json
 import logging
 import argparse
+from functools import lru_cache
 from typing import Dict, Any
 
-from rfq_tracker.crawler import RFQCrawler
-from rfq_tracker.db_manager import DBManager
-
+@lru_cache(maxsize=1)
 def load_config(config_path: str) -> Dict[str, Any]:
-    """Load configuration from a JSON file."""
+    """Load configuration from a JSON file (parsed once per path)."""
     try:
         with open(config_path, 'r') as f:
             config = json.load(f)
@@ -49,6 +48,13 @@ def main():
     )
     args = parser.parse_args()
 
+    # Deferred so --help and argument errors don't pay the pymongo/crawler
+    # import cost.
+    from pymongo.write_concern import WriteConcern
+
+    from rfq_tracker.crawler import RFQCrawler
+    from rfq_tracker.db_manager import DBManager
+
     # Configure logging
     log_level = logging.DEBUG if args.verbose else logging.INFO
     logging.basicConfig(
@@ -58,9 +64,12 @@ def main():
 
     config = load_config(args.config)
 
+    # Relaxed write concern: crawl writes are idempotent (content-hash keyed)
+    # and re-runnable, so skipping the journal-sync ack per batch is safe.
     db_manager = DBManager(
         mongo_uri=config.get("mongo_uri", "mongodb://localhost:27017"),
-        db_name=config.get("mongo_db", "rfq_tracker")
+        db_name=config.get("mongo_db", "rfq_tracker"),
+        write_concern=WriteConcern(w=1, j=False)
     )
 
     crawler = RFQCrawler(config=config, db_manager=db_manager, dry_run=args.dry_run)
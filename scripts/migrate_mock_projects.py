@@ -6,6 +6,8 @@ Legacy: Projects/{project}/RFQ/{supplier}/{Received|Sent}/{date}/
 New: Projects/{project}/1-RFQ/Supplier RFQ Quotes/{supplier}/{Received|Sent}/{date}/
 """
 
+import errno
+import os
 import shutil
 import sys
 from pathlib import Path
@@ -50,10 +52,11 @@ def migrate_project_folder(project_path: Path, dry_run: bool = False):
         print(f"  Would create: {new_supplier_quotes_path}")
 
         # List suppliers that would be moved
-        suppliers = [
-            d.name for d in rfq_folder.iterdir()
-            if d.is_dir() and not d.name.startswith('.')
-        ]
+        with os.scandir(rfq_folder) as it:
+            suppliers = [
+                e.name for e in it
+                if e.is_dir(follow_symlinks=False) and not e.name.startswith('.')
+            ]
         for supplier in suppliers:
             print(f"  Would move: {supplier} -> {new_supplier_quotes_path / supplier}")
     else:
@@ -61,18 +64,32 @@ def migrate_project_folder(project_path: Path, dry_run: bool = False):
         new_supplier_quotes_path.mkdir(parents=True, exist_ok=True)
         print(f"  ✓ Created: {new_supplier_quotes_path}")
 
-        # Move each supplier folder
-        for supplier_folder in rfq_folder.iterdir():
-            if supplier_folder.is_dir() and not supplier_folder.name.startswith('.'):
-                new_supplier_path = new_supplier_quotes_path / supplier_folder.name
-
-                # Move the supplier folder
-                shutil.move(str(supplier_folder), str(new_supplier_path))
-                print(f"  ✓ Moved: {supplier_folder.name} -> {new_supplier_path}")
+        # Move each supplier folder. scandir gives dir-ness from the cached
+        # d_type, so one getdents pass covers the whole listing without a
+        # stat per entry.
+        with os.scandir(rfq_folder) as it:
+            supplier_names = [
+                e.name for e in it
+                if e.is_dir(follow_symlinks=False) and not e.name.startswith('.')
+            ]
+        for supplier_name in supplier_names:
+            new_supplier_path = new_supplier_quotes_path / supplier_name
+
+            # Same-filesystem moves are a single rename(2) syscall; fall
+            # back to copy+delete only across devices.
+            try:
+                os.replace(rfq_folder / supplier_name, new_supplier_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(str(rfq_folder / supplier_name), str(new_supplier_path))
+            print(f"  ✓ Moved: {supplier_name} -> {new_supplier_path}")
 
         # Remove old RFQ folder if empty
-        if not any(rfq_folder.iterdir()):
-            rfq_folder.rmdir()
+        with os.scandir(rfq_folder) as it:
+            empty = next(iter(it), None) is None
+        if empty:
+            os.rmdir(rfq_folder)
             print(f"  ✓ Removed empty legacy folder: {rfq_folder.name}")
         else:
             print(f"  ⚠ Legacy folder not empty, kept: {rfq_folder.name}")
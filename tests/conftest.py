@@ -0,0 +1,26 @@
+"""
+Shared test configuration.
+
+Compatibility shim: pymongo 4.11+ forwards a `sort` kwarg when UpdateOne/
+ReplaceOne operations are added to a bulk write, which mongomock (<= 4.3)
+does not accept — every bulk_write containing updates raises TypeError.
+Wrap the affected builder methods to drop the kwarg so DBManager's bulk
+upserts behave under mongomock the way they do against real MongoDB.
+"""
+
+import inspect
+
+import mongomock.collection
+
+
+def _strip_sort_kwarg(method):
+    def wrapper(self, *args, sort=None, **kwargs):
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+_builder = mongomock.collection.BulkOperationBuilder
+for _name in ("add_update", "add_replace"):
+    _method = getattr(_builder, _name)
+    if "sort" not in inspect.signature(_method).parameters:
+        setattr(_builder, _name, _strip_sort_kwarg(_method))
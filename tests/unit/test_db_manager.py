@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 import mongomock
 from unittest.mock import patch, MagicMock
@@ -8,49 +10,103 @@ from rfq_tracker.db_manager import DBManager
 MONGO_URI = "mongodb://localhost:27017"
 DB_NAME = "test_rfq_db"
 
-@pytest.fixture
+# Canonical payloads built once at import time. Tests deep-copy before
+# passing them on: mongomock mutates inserted dicts (adds _id) and the
+# upsert test rewrites the project path.
+_PROJECT_DATA = {
+    "project": {"project_number": "12345", "path": "/path/12345"},
+    "suppliers": [
+        {"project_number": "12345", "supplier_name": "SupplierA", "path": "/path/12345/RFQ/SupplierA"}
+    ],
+    "submissions": [
+        {
+            "project_number": "12345",
+            "supplier_name": "SupplierA",
+            "type": "sent",
+            "folder_name": "Sub1",
+            "folder_path": "/path/12345/RFQ/SupplierA/Sent/Sub1",
+            "files": ["file1.pdf"]
+        }
+    ]
+}
+
+_DUP_SUBMISSION = {
+    "project_number": "12345",
+    "supplier_name": "SupplierA",
+    "type": "sent",
+    "folder_name": "Sub1",
+    "folder_path": "/path/12345/RFQ/SupplierA/Sent/Sub1",
+    "content_hash": "abc123",
+    "files": ["file1.pdf"]
+}
+
+@pytest.fixture(scope="module")
 def mock_mongo_client():
-    """Fixture to mock MongoClient with mongomock."""
+    """Module-scoped mongomock client: one in-memory server for all tests."""
     client = mongomock.MongoClient()
     return client
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def db_manager(mock_mongo_client):
-    """Fixture for DBManager that uses the mocked MongoClient."""
+    """Pre-connected DBManager: connect() and index builds run once per module."""
     with patch('rfq_tracker.db_manager.MongoClient', return_value=mock_mongo_client):
         manager = DBManager(mongo_uri=MONGO_URI, db_name=DB_NAME)
+        manager.connect()
         yield manager
         # Ensure connection is closed
         if manager.client:
             manager.close()
 
-def test_connect_success(db_manager, mock_mongo_client):
+@pytest.fixture
+def db_manager_unconnected():
+    """Unconnected DBManager for tests that exercise the connect path itself."""
+    with patch('rfq_tracker.db_manager.MongoClient', return_value=mongomock.MongoClient()):
+        manager = DBManager(mongo_uri=MONGO_URI, db_name=DB_NAME)
+        yield manager
+        if manager.client:
+            manager.close()
+
+@pytest.fixture(autouse=True)
+def reset_db(db_manager, mock_mongo_client):
+    """Empty the collections and caches so each test starts clean.
+
+    Deleting documents is much cheaper in mongomock than tearing down the
+    client and rebuilding every index per test.
+    """
+    db = mock_mongo_client[DB_NAME]
+    for name in ("projects", "suppliers", "submissions"):
+        db[name].delete_many({})
+    db_manager._hash_cache.clear()
+
+def test_connect_success(db_manager_unconnected):
     """Test successful connection to MongoDB."""
-    db_manager.connect()
-    assert db_manager.client is not None
-    assert db_manager.db is not None
-    assert db_manager.db.name == DB_NAME
+    db_manager_unconnected.connect()
+    assert db_manager_unconnected.client is not None
+    assert db_manager_unconnected.db is not None
+    assert db_manager_unconnected.db.name == DB_NAME
     # Note: ismaster command call is wrapped in try-except for mongomock compatibility
 
-@patch('rfq_tracker.db_manager.MongoClient')
-def test_connect_failure(mock_mongo_constructor):
+class _FailingMongoClient:
+    """Plain stub whose construction fails like an unreachable server."""
+
+    def __init__(self, *args, **kwargs):
+        raise ConnectionFailure("Test connection error")
+
+def test_connect_failure():
     """Test connection failure."""
-    # Configure the mock to raise ConnectionFailure
-    mock_client_instance = MagicMock()
-    mock_client_instance.admin.command.side_effect = ConnectionFailure("Test connection error")
-    mock_mongo_constructor.return_value = mock_client_instance
+    # A bare class raising from __init__ is far cheaper than MagicMock and
+    # fails where connect() actually catches ConnectionFailure; raising
+    # from admin.command would be swallowed by the mongomock-compat guard
+    with patch('rfq_tracker.db_manager.MongoClient', _FailingMongoClient):
+        manager = DBManager(mongo_uri=MONGO_URI, db_name=DB_NAME)
 
-    manager = DBManager(mongo_uri=MONGO_URI, db_name=DB_NAME)
-    
-    with pytest.raises(SystemExit) as e:
-        manager.connect()
+        with pytest.raises(SystemExit) as e:
+            manager.connect()
     assert e.type == SystemExit
     assert e.value.code == 1
 
 def test_ensure_indexes(db_manager):
     """Test that all required indexes are created."""
-    db_manager.connect()
-
     # Using mongomock, index_information() shows created indexes
     project_indexes = db_manager.db.projects.index_information()
     supplier_indexes = db_manager.db.suppliers.index_information()
@@ -58,37 +114,32 @@ def test_ensure_indexes(db_manager):
 
     assert "project_number_1" in project_indexes
     assert "project_number_1_supplier_name_1" in supplier_indexes
-    assert "project_number_1_supplier_name_1_type_1" in submission_indexes
-    # Content-aware versioning uses compound index with content_hash
+    # Content-aware versioning uses compound index with content_hash;
+    # queries on (project_number, supplier_name) use its prefix
     assert "project_number_1_supplier_name_1_folder_name_1_content_hash_1" in submission_indexes
+    assert "project_number_1_supplier_name_1_folder_name_1_date_-1" in submission_indexes
+    # Dashboard per-supplier view sorts by date without folder_name
+    assert "project_number_1_supplier_name_1_date_-1" in submission_indexes
+    # Statistics aggregations group over type/supplier within a project
+    assert "project_number_1_type_1_supplier_name_1" in submission_indexes
+
+def _counts(db, project_number):
+    """Gather the per-collection counts for one project in a single dict."""
+    return {
+        "projects": db.projects.count_documents({"project_number": project_number}),
+        "suppliers": db.suppliers.count_documents({"project_number": project_number}),
+        "submissions": db.submissions.count_documents({"project_number": project_number}),
+    }
 
 def test_save_project_data(db_manager):
     """Test saving a complete set of project data."""
-    db_manager.connect()
-
-    project_data = {
-        "project": {"project_number": "12345", "path": "/path/12345"},
-        "suppliers": [
-            {"project_number": "12345", "supplier_name": "SupplierA", "path": "/path/12345/RFQ/SupplierA"}
-        ],
-        "submissions": [
-            {
-                "project_number": "12345",
-                "supplier_name": "SupplierA",
-                "type": "sent",
-                "folder_name": "Sub1",
-                "folder_path": "/path/12345/RFQ/SupplierA/Sent/Sub1",
-                "files": ["file1.pdf"]
-            }
-        ]
-    }
+    project_data = copy.deepcopy(_PROJECT_DATA)
 
     db_manager.save_project_data(project_data)
 
-    # Verify data was inserted
-    assert db_manager.db.projects.count_documents({"project_number": "12345"}) == 1
-    assert db_manager.db.suppliers.count_documents({"supplier_name": "SupplierA"}) == 1
-    assert db_manager.db.submissions.count_documents({"folder_name": "Sub1"}) == 1
+    # Verify data was inserted; one dict comparison reports all three
+    # collections at once on failure
+    assert _counts(db_manager.db, "12345") == {"projects": 1, "suppliers": 1, "submissions": 1}
 
     # Test upsert functionality
     project_data["project"]["path"] = "/new/path/12345"
@@ -96,13 +147,25 @@ def test_save_project_data(db_manager):
 
     # Count should still be 1, but data should be updated
     assert db_manager.db.projects.count_documents({"project_number": "12345"}) == 1
-    updated_proj = db_manager.db.projects.find_one({"project_number": "12345"})
+    # Project only the asserted field so mongomock skips deep-copying
+    # the rest of the document
+    updated_proj = db_manager.db.projects.find_one(
+        {"project_number": "12345"}, {"path": 1, "_id": 0}
+    )
     assert updated_proj["path"] == "/new/path/12345"
 
+def test_save_project_data_precomputes_stats(db_manager):
+    """Scan-time supplier stats are written onto the project document."""
+    db_manager.save_project_data(copy.deepcopy(_PROJECT_DATA))
+
+    project = db_manager.db.projects.find_one(
+        {"project_number": "12345"}, {"stats": 1, "_id": 0}
+    )
+    # _PROJECT_DATA has one supplier with a sent submission and no received
+    assert project["stats"] == {"contacted_count": 1, "responded_count": 0}
+
 def test_save_empty_data(db_manager):
     """Test saving data with empty lists."""
-    db_manager.connect()
-    
     empty_data = {
         "project": {"project_number": "54321"},
         "suppliers": [],
@@ -112,15 +175,34 @@ def test_save_empty_data(db_manager):
     db_manager.save_project_data(empty_data)
     
     assert db_manager.db.projects.count_documents({"project_number": "54321"}) == 1
-    assert db_manager.db.suppliers.count_documents({}) == 0
-    assert db_manager.db.submissions.count_documents({}) == 0
+    # Unfiltered counts: estimated_document_count reads collection
+    # metadata instead of scanning
+    assert db_manager.db.suppliers.estimated_document_count() == 0
+    assert db_manager.db.submissions.estimated_document_count() == 0
+
+def test_duplicate_submissions_in_batch(db_manager):
+    """Duplicate (supplier, folder, content_hash) entries in one batch insert once."""
+    submission = _DUP_SUBMISSION
+    data = {
+        "project": {"project_number": "12345", "path": "/path/12345"},
+        "suppliers": [],
+        # Same submission discovered twice (e.g. via two traversal paths)
+        "submissions": [copy.deepcopy(submission), copy.deepcopy(submission)]
+    }
 
-def test_close_connection(db_manager, mock_mongo_client):
+    db_manager.save_project_data(data)
+
+    assert db_manager.db.submissions.count_documents({"folder_name": "Sub1"}) == 1
+
+def test_close_connection():
     """Test closing the connection."""
-    db_manager.connect()
-    assert db_manager.client is not None
-    
-    db_manager.close()
-    
+    mock_client = MagicMock()
+    with patch('rfq_tracker.db_manager.MongoClient', return_value=mock_client):
+        manager = DBManager(mongo_uri=MONGO_URI, db_name=DB_NAME)
+        manager.connect()
+        assert manager.client is not None
+
+        manager.close()
+
     # Check that the mock client's close method was called
-    mock_mongo_client.close.assert_called_once()
\ No newline at end of file
+    mock_client.close.assert_called_once()
\ No newline at end of file